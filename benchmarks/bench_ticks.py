@@ -0,0 +1,60 @@
+"""Allocations and time per tick for the pricing decoder.
+
+Compares keeping the parsed ``json.loads`` tree (every field of every price)
+against ``decode_prices``, which keeps one ``Tick`` per price. Allocations
+are counted as traced memory blocks still alive while the result is held,
+divided by the number of instruments.
+
+Run from the repository root: python benchmarks/bench_ticks.py
+"""
+import gc
+import json
+import time
+import tracemalloc
+import importlib.util
+
+# Load ticks.py on its own; importing the src package pulls in the GUI.
+spec = importlib.util.spec_from_file_location("ticks", "src/ticks.py")
+ticks = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(ticks)
+
+PRICE = ('{{"type":"PRICE","time":"1466620896.201836422",'
+         '"bids":[{{"price":"1.1{i:04d}","liquidity":10000000}},{{"price":"1.1{i:04d}","liquidity":10000000}}],'
+         '"asks":[{{"price":"1.1{j:04d}","liquidity":10000000}},{{"price":"1.1{j:04d}","liquidity":10000000}}],'
+         '"closeoutBid":"1.1{i:04d}","closeoutAsk":"1.1{j:04d}","status":"tradeable","tradeable":true,'
+         '"unitsAvailable":{{"default":{{"long":"2013434","short":"2013434"}}}},'
+         '"quoteHomeConversionFactors":{{"positiveUnits":"1.0","negativeUnits":"1.0"}},'
+         '"instrument":"P{i:02d}_USD"}}')
+
+def payload(n):
+    prices = ",".join(PRICE.format(i=i, j=i + 2) for i in range(n))
+    return f'{{"prices":[{prices}],"time":"1466620896.277811043"}}'.encode()
+
+def parsed_tree(body):
+    return json.loads(body)
+
+def measure(fn, body, n, rounds=2000):
+    fn(body)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = fn(body)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename")
+                 if stat.traceback[0].filename != tracemalloc.__file__)
+    del result
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(body)
+    return blocks / n, (time.perf_counter() - start) / rounds / n * 1e6
+
+def main():
+    for n in (1, 10, 50):
+        body = payload(n)
+        for name, fn in (("json tree", parsed_tree), ("decode_prices", ticks.decode_prices)):
+            blocks, usec = measure(fn, body, n)
+            print(f"{n:3d} instruments  {name:14s} {blocks:6.1f} blocks/tick  {usec:6.2f} us/tick")
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,9 @@ import sys
 import asyncio
 import logging
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QTextEdit, QLabel, QHBoxLayout
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import QTimer
+from asyncqt import QEventLoop
+from src.api_handler import create_session
 from src.trader import run_bot
 from src.chart_window import ChartWindow
 from src.signal_emitter import notifier
@@ -13,22 +15,6 @@ logging.basicConfig(filename="gui_log.txt", level=logging.INFO,
                     format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-class BotThread(QThread):
-    log_signal = pyqtSignal(str)
-
-    def run(self):
-        cfg = load_config()
-        account_id = cfg.get("OANDA_ACCOUNT_ID")
-        token = cfg.get("OANDA_API_TOKEN")
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(run_bot(account_id, token))
-        except Exception as e:
-            self.log_signal.emit(f"Bot Error: {e}")
-        finally:
-            loop.close()
-
 class TradingBotApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -36,8 +22,10 @@ class TradingBotApp(QWidget):
         self.setGeometry(100, 100, 800, 500)
         self.setStyleSheet(styles.WINDOW_STYLE)
 
-        self.bot_thread = None
+        self.bot_task = None
         self.chart_window = None
+        self.session = None
+        self.bars = {}
 
         self.layout = QVBoxLayout()
         self.status_label = QLabel("Status: Idle")
@@ -71,17 +59,36 @@ class TradingBotApp(QWidget):
 
         notifier.signal.connect(self.append_log)
         self.timer = QTimer()
-        self.timer.timeout.connect(lambda: self.status_label.setText("Status: Running..."))
+        self.timer.timeout.connect(self.refresh_status)
         self.timer.start(10000)
 
+    def get_session(self):
+        if self.session is None:
+            self.session = create_session()
+        return self.session
+
+    def refresh_status(self):
+        if self.bot_task is not None and not self.bot_task.done():
+            self.status_label.setText("Status: Running...")
+
     def start_bot(self):
+        if self.bot_task is not None and not self.bot_task.done():
+            return
+        cfg = load_config()
         self.status_label.setText("Status: Running")
-        self.bot_thread = BotThread()
-        self.bot_thread.log_signal.connect(self.append_log)
-        self.bot_thread.start()
+        self.bot_task = asyncio.ensure_future(
+            run_bot(cfg.get("OANDA_ACCOUNT_ID"), cfg.get("OANDA_API_TOKEN"), self.get_session(), self.bars))
+        self.bot_task.add_done_callback(self.bot_finished)
+
+    def bot_finished(self, task):
+        self.status_label.setText("Status: Stopped" if task.cancelled() else "Status: Idle")
+        if not task.cancelled() and task.exception():
+            self.append_log(f"Bot Error: {task.exception()}")
 
     def stop_bot(self):
-        self.status_label.setText("Status: Stopped")
+        if self.bot_task is None or self.bot_task.done():
+            return
+        self.bot_task.cancel()
         logger.info("Bot manually stopped.")
         self.append_log("Bot manually stopped.")
 
@@ -92,14 +99,30 @@ class TradingBotApp(QWidget):
 
     def show_chart(self):
         cfg = load_config()
-        self.chart_window = ChartWindow(cfg["OANDA_ACCOUNT_ID"], cfg["OANDA_API_TOKEN"])
+        if self.chart_window is not None:
+            self.chart_window.close()
+        self.chart_window = ChartWindow(self.bars, cfg["PAIRS"][0], cfg["SIGNAL_TIMEFRAME"])
         self.chart_window.show()
 
     def append_log(self, msg):
         self.log_output.append(msg)
 
-if __name__ == "__main__":
+    async def shutdown(self):
+        if self.bot_task is not None:
+            self.bot_task.cancel()
+            await asyncio.gather(self.bot_task, return_exceptions=True)
+        if self.session is not None:
+            await self.session.close()
+
+def main():
     app = QApplication(sys.argv)
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
     window = TradingBotApp()
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    with loop:
+        loop.run_forever()
+        loop.run_until_complete(window.shutdown())
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -2,7 +2,16 @@
 
 from .api_handler import (
     fetch_price,
-    place_order
+    fetch_ticks,
+    fetch_ticks_async,
+    place_order,
+    place_order_async,
+    create_session
+)
+
+from .ticks import (
+    Tick,
+    decode_prices
 )
 
 from .trader import (
@@ -13,6 +22,10 @@ from .signal_emitter import (
     notifier as SignalEmitter
 )
 
+from .polling import (
+    PollScheduler
+)
+
 from .config_manager import (
     load_config
 )
@@ -22,19 +35,46 @@ from .indicators import (
     calculate_ema
 )
 
+from .bars import (
+    BarBuilder,
+    BAR_DTYPE,
+    TIMEFRAMES
+)
+
+from .strategies import (
+    Strategy,
+    RsiEmaStrategy,
+    StrategyEngine,
+    OrderIntent,
+    load_strategies
+)
+
 from .chart_window import (
-    ChartWindow,
-    AsyncWorker
+    ChartWindow
 )
 
 __all__ = [
     "fetch_price",
+    "fetch_ticks",
+    "fetch_ticks_async",
+    "Tick",
+    "decode_prices",
     "place_order",
+    "place_order_async",
+    "create_session",
     "run_bot",
     "SignalEmitter",
+    "PollScheduler",
     "load_config",
     "calculate_rsi",
     "calculate_ema",
-    "ChartWindow",
-    "AsyncWorker"
+    "BarBuilder",
+    "BAR_DTYPE",
+    "TIMEFRAMES",
+    "Strategy",
+    "RsiEmaStrategy",
+    "StrategyEngine",
+    "OrderIntent",
+    "load_strategies",
+    "ChartWindow"
 ]
@@ -3,39 +3,68 @@ import json
 import time
 import urllib.request
 import urllib.error
+import asyncio
 import logging
+import aiohttp
+from .ticks import decode_prices
 
 logger = logging.getLogger(__name__)
 API_URL = "https://api-fxpractice.oanda.com/v3"
 
-def oanda_request(url, token, method="GET", data=None, retries=3, backoff=2):
-    req = urllib.request.Request(url, data=data, method=method)
-    req.add_header("Authorization", f"Bearer {token}")
-    req.add_header("Content-Type", "application/json")
+def oanda_headers(token):
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "Accept-Datetime-Format": "UNIX"
+    }
+
+def create_session():
+    """One pooled HTTP session to share between the bot, charts and UI."""
+    return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+
+def oanda_request(url, token, method="GET", data=None, retries=3, backoff=2, raw=False):
+    req = urllib.request.Request(url, data=data, method=method, headers=oanda_headers(token))
 
     for attempt in range(1, retries + 1):
         try:
             with urllib.request.urlopen(req, timeout=10) as response:
-                return json.loads(response.read().decode())
+                body = response.read()
+                return body if raw else json.loads(body.decode())
         except Exception as e:
             logger.warning(f"Attempt {attempt}: {e}")
-            time.sleep(backoff * attempt)
+            if attempt < retries:
+                time.sleep(backoff * attempt)
     return None
 
-def fetch_price(account_id, token, pair):
-    url = f"{API_URL}/accounts/{account_id}/pricing?instruments={pair}"
-    result = oanda_request(url, token)
-    if isinstance(result, dict) and "prices" in result and result["prices"]:
+async def oanda_request_async(session, url, token, method="GET", data=None, retries=3, backoff=2, raw=False):
+    for attempt in range(1, retries + 1):
         try:
-            bid = float(result["prices"][0]["bids"][0]["price"])
-            ask = float(result["prices"][0]["asks"][0]["price"])
-            return round((bid + ask) / 2, 5)
+            async with session.request(method, url, data=data, headers=oanda_headers(token)) as response:
+                response.raise_for_status()
+                body = await response.read()
+                return body if raw else json.loads(body.decode())
         except Exception as e:
-            logger.error(f"Price parse error: {e}")
+            logger.warning(f"Attempt {attempt}: {e}")
+            if attempt < retries:
+                await asyncio.sleep(backoff * attempt)
     return None
 
-def place_order(account_id, token, pair, units, stop_loss=None, take_profit=None):
-    url = f"{API_URL}/accounts/{account_id}/orders"
+def pricing_url(account_id, pairs):
+    return f"{API_URL}/accounts/{account_id}/pricing?instruments={','.join(pairs)}"
+
+def fetch_ticks(account_id, token, pairs):
+    result = oanda_request(pricing_url(account_id, pairs), token, raw=True)
+    return decode_prices(result) if result else []
+
+async def fetch_ticks_async(session, account_id, token, pairs):
+    result = await oanda_request_async(session, pricing_url(account_id, pairs), token, raw=True)
+    return decode_prices(result) if result else []
+
+def fetch_price(account_id, token, pair):
+    ticks = fetch_ticks(account_id, token, [pair])
+    return ticks[0].mid if ticks else None
+
+def order_payload(pair, units, stop_loss=None, take_profit=None):
     order = {
         "order": {
             "units": str(units),
@@ -48,8 +77,20 @@ def place_order(account_id, token, pair, units, stop_loss=None, take_profit=None
     if stop_loss and take_profit:
         order["order"]["stopLossOnFill"] = {"price": str(stop_loss)}
         order["order"]["takeProfitOnFill"] = {"price": str(take_profit)}
-    data = json.dumps(order).encode()
+    return json.dumps(order).encode()
+
+def place_order(account_id, token, pair, units, stop_loss=None, take_profit=None):
+    url = f"{API_URL}/accounts/{account_id}/orders"
+    data = order_payload(pair, units, stop_loss, take_profit)
     result = oanda_request(url, token, method="POST", data=data)
     if result and "orderFillTransaction" in result:
         return result["orderFillTransaction"].get("id", "")
     return None
+
+async def place_order_async(session, account_id, token, pair, units, stop_loss=None, take_profit=None):
+    url = f"{API_URL}/accounts/{account_id}/orders"
+    data = order_payload(pair, units, stop_loss, take_profit)
+    result = await oanda_request_async(session, url, token, method="POST", data=data)
+    if result and "orderFillTransaction" in result:
+        return result["orderFillTransaction"].get("id", "")
+    return None
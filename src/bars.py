@@ -0,0 +1,105 @@
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TIMEFRAMES = {"S30": 30, "M1": 60, "M5": 300, "H1": 3600}
+
+BAR_DTYPE = np.dtype([
+    ("time", "f8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8")
+])
+
+class BarBuilder:
+    """Aggregates ticks into OHLCV bars for several timeframes at once.
+
+    The open bar is kept in plain per-field lists and closed bars are copied
+    into a preallocated ring buffer per timeframe, so each tick does a fixed
+    amount of work and creates no containers. Volume counts ticks unless an
+    explicit volume is passed. ``on_close(name, bar)`` is called with a view
+    of each bar as it closes. Gaps produce no empty bars unless ``fill_gaps``
+    is set, in which case each skipped period closes as a flat zero-volume
+    bar, so closed bars sit on a fixed time grid.
+    """
+
+    def __init__(self, timeframes=None, capacity=500, on_close=None, fill_gaps=False):
+        timeframes = timeframes or TIMEFRAMES
+        self.names = list(timeframes)
+        self.seconds = [timeframes[name] for name in self.names]
+        self.capacity = capacity
+        self.on_close = on_close
+        self.fill_gaps = fill_gaps
+        self.closed = np.zeros((len(self.names), capacity), dtype=BAR_DTYPE)
+        self.counts = [0] * len(self.names)
+        # The open bar lives in plain lists; only closed bars hit numpy.
+        self.starts = [None] * len(self.names)
+        self.opens = [0.0] * len(self.names)
+        self.highs = [0.0] * len(self.names)
+        self.lows = [0.0] * len(self.names)
+        self.closes = [0.0] * len(self.names)
+        self.volumes = [0.0] * len(self.names)
+
+    def update(self, timestamp, price, volume=1):
+        for i, seconds in enumerate(self.seconds):
+            start = timestamp - timestamp % seconds
+            current = self.starts[i]
+            if start == current:
+                if price > self.highs[i]:
+                    self.highs[i] = price
+                elif price < self.lows[i]:
+                    self.lows[i] = price
+                self.closes[i] = price
+                self.volumes[i] += volume
+                continue
+            if current is not None:
+                if start < current:
+                    logger.warning(f"Out-of-order tick at {timestamp} ignored for {self.names[i]}")
+                    continue
+                self._close(i)
+                if self.fill_gaps:
+                    self._fill(i, current, start)
+            self.starts[i] = start
+            self.opens[i] = self.highs[i] = self.lows[i] = self.closes[i] = price
+            self.volumes[i] = volume
+
+    def _close(self, i):
+        slot = self.counts[i] % self.capacity
+        self.closed[i, slot] = (self.starts[i], self.opens[i], self.highs[i],
+                                self.lows[i], self.closes[i], self.volumes[i])
+        self.counts[i] += 1
+        if self.on_close:
+            self.on_close(self.names[i], self.closed[i, slot])
+
+    def _fill(self, i, current, start):
+        seconds = self.seconds[i]
+        missing = min(round((start - current) / seconds) - 1, self.capacity)
+        close = self.closes[i]
+        for k in range(missing, 0, -1):
+            self.starts[i] = start - k * seconds
+            self.opens[i] = self.highs[i] = self.lows[i] = close
+            self.volumes[i] = 0
+            self._close(i)
+
+    def bars(self, name):
+        """Return a copy of the closed bars for ``name``, oldest first."""
+        i = self.names.index(name)
+        count = self.counts[i]
+        if count <= self.capacity:
+            return self.closed[i, :count].copy()
+        slot = count % self.capacity
+        return np.concatenate((self.closed[i, slot:], self.closed[i, :slot]))
+
+    def count(self, name):
+        """Number of bars closed so far for ``name``."""
+        return self.counts[self.names.index(name)]
+
+    def recent(self, name, n):
+        """Return a copy of the last ``n`` closed bars for ``name``, oldest first."""
+        i = self.names.index(name)
+        count = self.counts[i]
+        n = min(n, count, self.capacity)
+        return self.closed[i, np.arange(count - n, count) % self.capacity]
@@ -1,26 +1,29 @@
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel
 from PyQt5.QtCore import QTimer
 import matplotlib.pyplot as plt
+import mplfinance as mpf
+import pandas as pd
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from datetime import datetime
-import numpy as np
-import asyncio
-from src.api_handler import fetch_price
 from src.indicators import calculate_ema, calculate_rsi
 from src.config_manager import load_config
 
 class ChartWindow(QDialog):
-    def __init__(self, account_id, token, pair="EUR_USD"):
+    """Candlestick chart of the bars the running bot builds for ``pair``.
+
+    ``bars`` is the dict passed to ``run_bot``; it is looked up on every
+    redraw, so the chart can be opened before the bot starts.
+    """
+
+    def __init__(self, bars, pair="EUR_USD", timeframe="M1"):
         super().__init__()
-        self.setWindowTitle(f"Live Chart - {pair}")
+        self.setWindowTitle(f"Live Chart - {pair} {timeframe}")
         self.setGeometry(300, 300, 1000, 600)
         self.pair = pair
-        self.account_id = account_id
-        self.token = token
-        self.prices = []
-        self.timestamps = []
+        self.timeframe = timeframe
+        self.bars = bars
+        self.config = load_config()
 
-        self.label = QLabel("Fetching...", self)
+        self.label = QLabel("Waiting for bars...", self)
         self.fig, self.ax = plt.subplots()
         self.canvas = FigureCanvas(self.fig)
 
@@ -30,29 +33,42 @@ class ChartWindow(QDialog):
         self.setLayout(layout)
 
         self.timer = QTimer()
-        self.timer.timeout.connect(lambda: asyncio.create_task(self.update_chart()))
+        self.timer.timeout.connect(self.update_chart)
         self.timer.start(5000)
 
-    async def update_chart(self):
-        price = await fetch_price(self.account_id, self.token, self.pair)
-        if price:
-            self.prices.append(price)
-            self.timestamps.append(datetime.now())
-            if len(self.prices) > 100:
-                self.prices.pop(0)
-                self.timestamps.pop(0)
-
-            self.label.setText(f"{self.pair} Price: {price:.5f}")
-            self.ax.clear()
-            self.ax.plot(self.timestamps, self.prices, label="Price")
-            if len(self.prices) >= 20:
-                ema = calculate_ema(np.array(self.prices), 20)
-                self.ax.axhline(ema, color='cyan', linestyle='--', label="EMA")
-            if len(self.prices) >= 15:
-                rsi = calculate_rsi(np.array(self.prices), 14)
-                self.ax.set_title(f"RSI: {rsi:.2f}")
+    def done(self, result):
+        self.timer.stop()
+        plt.close(self.fig)
+        super().done(result)
+
+    @staticmethod
+    def candle_frame(candles):
+        return pd.DataFrame({
+            "Open": candles["open"],
+            "High": candles["high"],
+            "Low": candles["low"],
+            "Close": candles["close"],
+            "Volume": candles["volume"]
+        }, index=pd.to_datetime(candles["time"], unit="s"))
+
+    def update_chart(self):
+        builder = self.bars.get(self.pair)
+        candles = builder.bars(self.timeframe) if builder else []
+        if len(candles) < 2:
+            self.label.setText("Waiting for bars...")
+            return
+
+        closes = candles["close"]
+        self.label.setText(f"{self.pair} Close: {closes[-1]:.5f}")
+        self.ax.clear()
+        mpf.plot(self.candle_frame(candles), type="candle", ax=self.ax)
+        ema_period = self.config["EMA_PERIOD"]
+        rsi_period = self.config["RSI_PERIOD"]
+        if len(closes) >= ema_period:
+            ema = calculate_ema(closes, ema_period)
+            self.ax.axhline(ema, color='cyan', linestyle='--', label="EMA")
             self.ax.legend()
-            self.fig.autofmt_xdate()
-            self.canvas.draw()
-        else:
-            self.label.setText("Price fetch failed.")
+        if len(closes) > rsi_period:
+            rsi = calculate_rsi(closes, rsi_period)
+            self.ax.set_title(f"RSI: {rsi:.2f}")
+        self.canvas.draw()
@@ -15,7 +15,12 @@ DEFAULT_CONFIG = {
     "RSI_BUY_THRESHOLD": 30,
     "RSI_SELL_THRESHOLD": 70,
     "STOP_LOSS_PERCENTAGE": 0.02,
-    "TAKE_PROFIT_PERCENTAGE": 0.03
+    "TAKE_PROFIT_PERCENTAGE": 0.03,
+    "SIGNAL_TIMEFRAME": "S30",
+    "POLL_MIN_INTERVAL": 5,
+    "POLL_MAX_INTERVAL": 120,
+    "POLL_BUDGET": 30,
+    "POLL_RSI_BAND": 15
 }
 
 def load_config():
@@ -20,3 +20,32 @@ def calculate_ema(prices, period):
     weights = np.exp(np.linspace(-1., 0., period))
     weights /= weights.sum()
     return round(np.convolve(prices[-period:], weights, mode='valid')[0], 5)
+
+def calculate_rsi_batch(history, counts, period):
+    """RSI for every row of a right-aligned (pairs, window) price matrix."""
+    window = history[:, -(period + 1):]
+    with np.errstate(invalid="ignore"):
+        deltas = np.diff(window, axis=1)
+        avg_gain = np.maximum(deltas, 0).mean(axis=1)
+        avg_loss = np.abs(np.minimum(deltas, 0)).mean(axis=1)
+        avg_loss[avg_loss == 0] = 1e-10
+        rsi = np.round(100 - (100 / (1 + avg_gain / avg_loss)), 2)
+    return np.where(counts < period + 1, 50.0, rsi)
+
+def calculate_ema_batch(history, counts, period):
+    """EMA for every row of a right-aligned (pairs, window) price matrix."""
+    weights = np.exp(np.linspace(-1., 0., period))
+    weights /= weights.sum()
+    with np.errstate(invalid="ignore"):
+        # np.convolve flips its kernel; mirror that to match calculate_ema.
+        ema = history[:, -period:] @ weights[::-1]
+        short = np.nansum(history, axis=1) / np.maximum(counts, 1)
+    short[counts == 0] = np.nan
+    return np.round(np.where(counts < period, short, ema), 5)
+
+def calculate_volatility_batch(history, counts, period):
+    """Standard deviation of the last ``period`` log returns per row."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = np.diff(np.log(history[:, -(period + 1):]), axis=1)
+        vol = returns.std(axis=1)
+    return np.where(counts < period + 1, np.nan, vol)
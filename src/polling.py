@@ -0,0 +1,85 @@
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class PollScheduler:
+    """Per-pair polling intervals driven by signal proximity and volatility.
+
+    A pair's urgency is the larger of how close any registered strategy is
+    to triggering on it (``Strategy.proximity``) and how far short-term
+    volatility exceeds its longer-term level. Urgency 1 polls every
+    ``POLL_MIN_INTERVAL`` seconds, urgency 0 backs off to
+    ``POLL_MAX_INTERVAL``. Pairs falling due close together
+    share a single request, and requests are spaced at least
+    ``60 / POLL_BUDGET`` seconds apart, so the budget bounds requests
+    rather than per-pair rates.
+    """
+    SHORT_VOL_PERIOD = 5
+    LONG_VOL_PERIOD = 30
+
+    def __init__(self, pairs, config, now=0.0):
+        self.pairs = list(pairs)
+        self.min_interval = config["POLL_MIN_INTERVAL"]
+        self.max_interval = max(config["POLL_MAX_INTERVAL"], self.min_interval)
+        self.budget = config["POLL_BUDGET"]
+        self.rsi_band = config["POLL_RSI_BAND"]
+        if not self.pairs:
+            raise ValueError("PollScheduler needs at least one pair")
+        if self.budget <= 0:
+            raise ValueError(f"POLL_BUDGET must be positive, got {self.budget}")
+        if self.min_interval <= 0:
+            raise ValueError(f"POLL_MIN_INTERVAL must be positive, got {self.min_interval}")
+        if self.rsi_band <= 0:
+            raise ValueError(f"POLL_RSI_BAND must be positive, got {self.rsi_band}")
+        self.warmup_interval = min(max(config["TRADE_INTERVAL"], self.min_interval), self.max_interval)
+        self.next_poll = np.full(len(self.pairs), float(now))
+        self.current = np.full(len(self.pairs), float(self.warmup_interval))
+        self.last_poll = np.full(len(self.pairs), -np.inf)
+        self.last_request = None
+
+    def due(self, now):
+        """Boolean mask of pairs to include in a request made at ``now``.
+
+        Pairs due within half a minimum interval ride along, but only if
+        at least ``POLL_MIN_INTERVAL`` has passed since their last poll.
+        """
+        early = (self.next_poll <= now + self.min_interval / 2) & (now - self.last_poll >= self.min_interval)
+        return (self.next_poll <= now) | early
+
+    def begin(self, now, polled):
+        """Record a request attempt before it is made.
+
+        The polled pairs are pushed out by their current interval, so a
+        failed attempt still backs off instead of retrying immediately.
+        """
+        self.last_request = now
+        self.last_poll[polled] = now
+        self.next_poll[polled] = now + self.current[polled]
+
+    def wait(self, now):
+        """Seconds until the next request may be made, never sooner than
+        ``60 / POLL_BUDGET`` after the last attempt."""
+        delay = self.next_poll.min() - now
+        if self.last_request is not None:
+            delay = max(delay, self.last_request + 60 / self.budget - now)
+        return max(delay, 0.0)
+
+    def urgency(self, proximity, short_vol, long_vol):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            surge = np.nan_to_num(np.clip(short_vol / long_vol - 1, 0, 1))
+        return np.maximum(proximity, surge)
+
+    def intervals(self, urgency, warm):
+        intervals = self.max_interval - urgency * (self.max_interval - self.min_interval)
+        return np.where(warm, intervals, self.warmup_interval)
+
+    def schedule(self, now, polled, engine):
+        """Set the next poll time of the ``polled`` pairs from engine state."""
+        proximity = engine.proximity(self.rsi_band)
+        short_vol = engine.indicator("volatility", self.SHORT_VOL_PERIOD)
+        long_vol = engine.indicator("volatility", self.LONG_VOL_PERIOD)
+        warm = engine.counts > engine.max_period
+        self.current = self.intervals(self.urgency(proximity, short_vol, long_vol), warm)
+        self.next_poll[polled] = now + self.current[polled]
+        return self.current
@@ -0,0 +1,196 @@
+import logging
+from collections import namedtuple
+import numpy as np
+from .indicators import calculate_rsi_batch, calculate_ema_batch, calculate_volatility_batch
+
+logger = logging.getLogger(__name__)
+
+INDICATORS = {
+    "rsi": calculate_rsi_batch,
+    "ema": calculate_ema_batch,
+    "volatility": calculate_volatility_batch
+}
+
+OrderIntent = namedtuple("OrderIntent", ["strategy", "pair", "units", "stop_loss", "take_profit"])
+
+class Strategy:
+    """Base class for strategy plugins.
+
+    Subclasses declare the indicators they need in ``requires`` and implement
+    ``signals`` as array code: every parameter arrives stacked as a
+    ``(strategies, 1)`` column and every feature as a ``(strategies, pairs)``
+    matrix, so all instances of one class are evaluated in a single call.
+    """
+    name = "strategy"
+    defaults = {
+        "TRADE_AMOUNT_UNITS": 1000,
+        "STOP_LOSS_PERCENTAGE": 0.02,
+        "TAKE_PROFIT_PERCENTAGE": 0.03
+    }
+
+    def __init__(self, **params):
+        self.params = {**self.defaults, **params}
+
+    def requires(self):
+        """Map feature name -> (indicator, period)."""
+        return {}
+
+    @classmethod
+    def signals(cls, price, features, params):
+        """Return an int8 matrix of +1 (buy), -1 (sell) or 0 per strategy and pair."""
+        raise NotImplementedError
+
+    @classmethod
+    def proximity(cls, price, features, params, band):
+        """How close each strategy and pair is to triggering, from 0 to 1.
+
+        Used to poll pairs faster near a trigger; the default never asks for
+        faster polling.
+        """
+        return np.zeros(1)
+
+class RsiEmaStrategy(Strategy):
+    name = "rsi_ema"
+    defaults = {
+        **Strategy.defaults,
+        "RSI_PERIOD": 14,
+        "EMA_PERIOD": 20,
+        "RSI_BUY_THRESHOLD": 30,
+        "RSI_SELL_THRESHOLD": 70
+    }
+
+    def requires(self):
+        return {
+            "rsi": ("rsi", self.params["RSI_PERIOD"]),
+            "ema": ("ema", self.params["EMA_PERIOD"])
+        }
+
+    @classmethod
+    def signals(cls, price, features, params):
+        rsi, ema = features["rsi"], features["ema"]
+        buy = (rsi < params["RSI_BUY_THRESHOLD"]) & (price < ema)
+        sell = (rsi > params["RSI_SELL_THRESHOLD"]) & (price > ema)
+        return buy.astype(np.int8) - sell.astype(np.int8)
+
+    @classmethod
+    def proximity(cls, price, features, params, band):
+        rsi, buy, sell = features["rsi"], params["RSI_BUY_THRESHOLD"], params["RSI_SELL_THRESHOLD"]
+        distance = np.minimum(np.abs(rsi - buy), np.abs(rsi - sell))
+        distance = np.where((rsi <= buy) | (rsi >= sell), 0, distance)
+        return np.clip(1 - distance / band, 0, 1)
+
+STRATEGIES = {cls.name: cls for cls in (RsiEmaStrategy,)}
+
+def load_strategies(config):
+    """Build strategy instances from ``config["STRATEGIES"]``.
+
+    Each entry is ``{"name": ..., **params}``; missing params fall back to the
+    top-level config, so the default entry reproduces the classic RSI/EMA rule.
+    """
+    strategies = []
+    for entry in config.get("STRATEGIES", [{"name": RsiEmaStrategy.name}]):
+        entry = dict(entry)
+        name = entry.pop("name", None)
+        cls = STRATEGIES.get(name)
+        if cls is None:
+            logger.error(f"Unknown strategy: {name}")
+            continue
+        unknown = set(entry) - set(cls.defaults)
+        if unknown:
+            logger.error(f"Unknown parameters for {name}: {sorted(unknown)}")
+            continue
+        params = {k: config[k] for k in cls.defaults if k in config}
+        strategies.append(cls(**{**params, **entry}))
+    return strategies
+
+def required_window(strategies, periods=(), minimum=100):
+    """History length that covers every period the strategies declare."""
+    periods = [period for s in strategies for _, period in s.requires().values()] + list(periods)
+    return max([minimum] + [period + 1 for period in periods])
+
+class StrategyEngine:
+    """Keeps a price matrix for all pairs and evaluates registered strategies.
+
+    Each distinct ``(indicator, period)`` is computed once per tick for every
+    pair at once, and each strategy class is evaluated once over all of its
+    instances and all pairs.
+    """
+
+    def __init__(self, pairs, strategies=(), window=100):
+        self.pairs = list(pairs)
+        self.history = np.full((len(self.pairs), window), np.nan)
+        self.counts = np.zeros(len(self.pairs), dtype=np.int64)
+        self.price = np.full(len(self.pairs), np.nan)
+        self.features = {}
+        self.groups = {}
+        self.max_period = 0
+        for strategy in strategies:
+            self.register(strategy)
+
+    def register(self, strategy):
+        for name, period in strategy.requires().values():
+            if period + 1 > self.history.shape[1]:
+                raise ValueError(f"{strategy.name}: {name} period {period} exceeds history window {self.history.shape[1]}")
+            self.max_period = max(self.max_period, period)
+        self.groups.setdefault(type(strategy), []).append(strategy)
+
+    def update(self, prices):
+        """Append the latest price per pair; NaN marks a missed fetch."""
+        prices = np.asarray(prices, dtype=float)
+        fresh = ~np.isnan(prices)
+        rows = self.history[fresh]
+        rows[:, :-1] = rows[:, 1:]
+        rows[:, -1] = prices[fresh]
+        self.history[fresh] = rows
+        self.counts[fresh] = np.minimum(self.counts[fresh] + 1, self.history.shape[1])
+        self.price = prices
+        self.features = {}
+
+    def indicator(self, name, period):
+        key = (name, period)
+        if key not in self.features:
+            self.features[key] = INDICATORS[name](self.history, self.counts, period)
+        return self.features[key]
+
+    def stack(self, cls, strategies):
+        """Features and params of one strategy class, stacked per instance."""
+        specs = [s.requires() for s in strategies]
+        features = {
+            alias: np.stack([self.indicator(*spec[alias]) for spec in specs])
+            for alias in specs[0]
+        }
+        params = {
+            k: np.array([s.params[k] for s in strategies])[:, None]
+            for k in cls.defaults
+        }
+        return features, params
+
+    def proximity(self, band):
+        """Per pair, the highest trigger proximity over all strategies."""
+        result = np.zeros(len(self.pairs))
+        for cls, strategies in self.groups.items():
+            features, params = self.stack(cls, strategies)
+            near = cls.proximity(self.price, features, params, band)
+            result = np.maximum(result, np.broadcast_to(near, (len(strategies), len(self.pairs))).max(axis=0))
+        return result
+
+    def evaluate(self):
+        """Return the list of OrderIntent produced by this tick."""
+        intents = []
+        live = ~np.isnan(self.price)
+        price = np.where(live, self.price, 0.0)
+        for cls, strategies in self.groups.items():
+            features, params = self.stack(cls, strategies)
+            signal = cls.signals(price, features, params) * live
+            rows, cols = np.nonzero(signal)
+            if not len(rows):
+                continue
+            side = signal[rows, cols]
+            units = side * params["TRADE_AMOUNT_UNITS"][rows, 0]
+            entry = price[cols]
+            stop_loss = np.round(entry * (1 - side * params["STOP_LOSS_PERCENTAGE"][rows, 0]), 5)
+            take_profit = np.round(entry * (1 + side * params["TAKE_PROFIT_PERCENTAGE"][rows, 0]), 5)
+            for i, (r, c) in enumerate(zip(rows, cols)):
+                intents.append(OrderIntent(strategies[r], self.pairs[c], int(units[i]),
+                                           float(stop_loss[i]), float(take_profit[i])))
+        return intents
@@ -0,0 +1,63 @@
+import json
+import time
+import calendar
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Tick:
+    """Top-of-book quote for one instrument."""
+    __slots__ = ("instrument", "time", "bid", "ask", "mid", "liquidity", "tradeable")
+
+    def __init__(self, instrument, time, bid, ask, liquidity=0, tradeable=True):
+        self.instrument = instrument
+        self.time = time
+        self.bid = bid
+        self.ask = ask
+        self.mid = round((bid + ask) / 2, 5)
+        self.liquidity = liquidity
+        self.tradeable = tradeable
+
+    @property
+    def spread(self):
+        return self.ask - self.bid
+
+    def __repr__(self):
+        return f"Tick({self.instrument}, {self.time}, bid={self.bid}, ask={self.ask})"
+
+def parse_time(value):
+    """Seconds since the epoch from an OANDA UNIX or RFC3339 timestamp."""
+    if isinstance(value, bytes):
+        value = value.decode()
+    if "T" not in value:
+        return float(value)
+    seconds = calendar.timegm(time.strptime(value[:19], "%Y-%m-%dT%H:%M:%S"))
+    fraction = value[19:].rstrip("Z")
+    return seconds + float(fraction) if fraction else float(seconds)
+
+def decode_prices(payload):
+    """Decode a pricing response or stream line into a list of Ticks.
+
+    Accepts single- and multi-instrument ``/pricing`` bodies as well as
+    ``/pricing/stream`` lines; heartbeats and prices without quotes are
+    skipped. Only the top-of-book fields are kept from the parsed tree.
+    """
+    try:
+        result = json.loads(payload)
+    except ValueError as e:
+        logger.error(f"Price decode error: {e}")
+        return []
+    prices = result.get("prices", [result]) if isinstance(result, dict) else []
+    ticks = []
+    for price in prices:
+        if not price.get("bids") or not price.get("asks"):
+            continue
+        try:
+            bid, ask = price["bids"][0], price["asks"][0]
+            ticks.append(Tick(price["instrument"], parse_time(price["time"]),
+                              float(bid["price"]), float(ask["price"]),
+                              min(int(bid["liquidity"]), int(ask["liquidity"])),
+                              price.get("tradeable", True)))
+        except Exception as e:
+            logger.error(f"Price parse error: {e}")
+    return ticks
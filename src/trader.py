@@ -2,63 +2,101 @@ import time
 import asyncio
 import logging
 import numpy as np
-from .api_handler import fetch_price, place_order
-from .indicators import calculate_rsi, calculate_ema
+from .api_handler import create_session, fetch_ticks_async, place_order_async
 from .signal_emitter import notifier
 from .config_manager import load_config
+from .strategies import StrategyEngine, load_strategies, required_window
+from .polling import PollScheduler
+from .bars import BarBuilder, TIMEFRAMES
 
 logger = logging.getLogger(__name__)
 config = load_config()
 
-async def trade(pair, prices, account_id, token):
-    price = await fetch_price(account_id, token, pair)
-    if price is None:
-        logger.error(f"Price fetch failed for {pair}")
-        return
+async def trade(engine, poller, bars, session, account_id, token):
+    now = time.time()
+    polled = poller.due(now)
+    pairs = [pair for pair, due in zip(engine.pairs, polled) if due]
+    poller.begin(now, polled)
+    ticks = await fetch_ticks_async(session, account_id, token, pairs)
+    quotes = {tick.instrument: tick for tick in ticks}
+    for pair in pairs:
+        if pair not in quotes:
+            logger.error(f"Price fetch failed for {pair}")
 
-    prices.append(price)
-    if len(prices) > 100:
-        prices.pop(0)
+    # Indicators run on closed bars of one timeframe, not on raw polls, so
+    # they span the same market time however often a pair is polled.
+    timeframe = config["SIGNAL_TIMEFRAME"]
+    closes = {}
+    for tick in ticks:
+        builder = bars.get(tick.instrument)
+        if builder is None:
+            continue
+        before = builder.count(timeframe)
+        builder.update(tick.time, tick.mid)
+        closed = builder.count(timeframe) - before
+        if closed:
+            closes[tick.instrument] = builder.recent(timeframe, min(closed, engine.history.shape[1]))["close"]
+    # Right-align catch-up bars so every pair with a new bar is live in the
+    # final update, which is the one evaluate() sees.
+    rounds = max((len(c) for c in closes.values()), default=0)
+    for r in range(rounds, 0, -1):
+        engine.update([closes[pair][-r] if len(closes.get(pair, ())) >= r else np.nan
+                       for pair in engine.pairs])
+    rsi = engine.indicator("rsi", config["RSI_PERIOD"])
+    ema = engine.indicator("ema", config["EMA_PERIOD"])
+    for i, pair in enumerate(engine.pairs):
+        if pair not in quotes:
+            continue
+        tick = quotes[pair]
+        msg = f"{pair} | Price: {tick.mid:.5f} | Spread: {tick.spread:.5f} | RSI: {rsi[i]:.2f} | EMA: {ema[i]:.5f}"
+        logger.info(msg)
+        notifier.emit_signal(msg)
+    poller.schedule(now, polled, engine)
+    if not closes:
+        return
 
-    rsi = calculate_rsi(np.array(prices), config["RSI_PERIOD"])
-    ema = calculate_ema(np.array(prices), config["EMA_PERIOD"])
-    msg = f"{pair} | Price: {price:.5f} | RSI: {rsi:.2f} | EMA: {ema:.5f}"
-    logger.info(msg)
-    notifier.emit_signal(msg)
+    # At most one evaluation per closed bar, so faster polling does not
+    # mean more frequent orders.
+    for intent in engine.evaluate():
+        order_id = await place_order_async(session, account_id, token, intent.pair, intent.units,
+                                           intent.stop_loss, intent.take_profit)
+        if order_id:
+            side = "Buy" if intent.units > 0 else "Sell"
+            notifier.emit_signal(f"{side} order placed: {order_id} ({intent.strategy.name})")
 
-    units = config["TRADE_AMOUNT_UNITS"]
-    stop_loss = take_profit = None
+async def run_bot(account_id, token, session=None, bars=None):
+    """Run one trading session.
 
-    if rsi < config["RSI_BUY_THRESHOLD"] and price < ema:
-        stop_loss = round(price * (1 - config["STOP_LOSS_PERCENTAGE"]), 5)
-        take_profit = round(price * (1 + config["TAKE_PROFIT_PERCENTAGE"]), 5)
-        order_id = place_order(account_id, token, pair, units, stop_loss, take_profit)
-        if order_id:
-            notifier.emit_signal(f"Buy order placed: {order_id}")
-    elif rsi > config["RSI_SELL_THRESHOLD"] and price > ema:
-        stop_loss = round(price * (1 + config["STOP_LOSS_PERCENTAGE"]), 5)
-        take_profit = round(price * (1 - config["TAKE_PROFIT_PERCENTAGE"]), 5)
-        order_id = place_order(account_id, token, pair, -units, stop_loss, take_profit)
-        if order_id:
-            notifier.emit_signal(f"Sell order placed: {order_id}")
+    ``bars`` may be a caller-owned dict; it is filled with one BarBuilder per
+    pair so charts can read the bars the bot builds from its ticks.
+    """
+    if session is None:
+        async with create_session() as session:
+            return await run_bot(account_id, token, session, bars)
 
-async def run_bot(account_id, token):
     config = load_config()
     end_time = time.time() + config["SESSION_DURATION"]
-    price_history = {pair: [] for pair in config["PAIRS"]}
+    strategies = load_strategies(config)
+    window = required_window(strategies, (config["RSI_PERIOD"], config["EMA_PERIOD"], PollScheduler.LONG_VOL_PERIOD))
+    engine = StrategyEngine(config["PAIRS"], strategies, window)
+    poller = PollScheduler(config["PAIRS"], config, time.time())
+    if config["SIGNAL_TIMEFRAME"] not in TIMEFRAMES:
+        raise ValueError(f"Unknown SIGNAL_TIMEFRAME: {config['SIGNAL_TIMEFRAME']}")
+    bars = {} if bars is None else bars
+    for pair in config["PAIRS"]:
+        bars[pair] = BarBuilder(capacity=max(500, window), fill_gaps=True)
 
     logger.info("Trading session started.")
     notifier.emit_signal("Trading session started.")
 
     while time.time() < end_time:
-        for pair in config["PAIRS"]:
-            try:
-                await trade(pair, price_history[pair], account_id, token)
-            except Exception as e:
-                err = f"{pair} trade error: {e}"
-                logger.error(err)
-                notifier.emit_signal(err)
-        await asyncio.sleep(config["TRADE_INTERVAL"])
+        try:
+            await trade(engine, poller, bars, session, account_id, token)
+        except Exception as e:
+            err = f"Trade error: {e}"
+            logger.error(err)
+            notifier.emit_signal(err)
+        await asyncio.sleep(poller.wait(time.time()))
 
     logger.info("Session ended.")
     notifier.emit_signal("Session ended.")
@@ -1,7 +1,61 @@
+import asyncio
 import unittest
+from unittest import mock
 from src import api_handler
 
+class FakeResponse:
+    def __init__(self, body=b"{}", error=None):
+        self.body = body
+        self.error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.error:
+            raise self.error
+
+    async def read(self):
+        return self.body
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, data=None, headers=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
 class TestAPIHandler(unittest.TestCase):
     def test_fetch_price_invalid_token(self):
         result = api_handler.fetch_price("INVALID", "XXX", "EUR_USD")
         self.assertIsNone(result)
+
+    def test_async_request_retries_http_errors(self):
+        session = FakeSession([FakeResponse(error=RuntimeError("503")), FakeResponse(b'{"ok": 1}')])
+        sleep = mock.AsyncMock()
+        with mock.patch.object(api_handler.asyncio, "sleep", sleep):
+            result = asyncio.run(api_handler.oanda_request_async(session, "URL", "TOKEN"))
+        self.assertEqual(result, {"ok": 1})
+        self.assertEqual(session.calls, 2)
+        sleep.assert_awaited_once_with(2)
+
+    def test_async_request_gives_up_without_final_sleep(self):
+        session = FakeSession([FakeResponse(error=RuntimeError("503")) for _ in range(3)])
+        sleep = mock.AsyncMock()
+        with mock.patch.object(api_handler.asyncio, "sleep", sleep):
+            result = asyncio.run(api_handler.oanda_request_async(session, "URL", "TOKEN"))
+        self.assertIsNone(result)
+        self.assertEqual(session.calls, 3)
+        self.assertEqual([c.args for c in sleep.await_args_list], [(2,), (4,)])
+
+    def test_async_fetch_ticks_decodes_raw_body(self):
+        body = b'{"prices": [{"instrument": "EUR_USD", "time": "1700000000.5", "bids": [{"price": "1.1", "liquidity": 1}], "asks": [{"price": "1.2", "liquidity": 1}]}]}'
+        session = FakeSession([FakeResponse(body)])
+        tick, = asyncio.run(api_handler.fetch_ticks_async(session, "ACCOUNT", "TOKEN", ["EUR_USD"]))
+        self.assertEqual(tick.instrument, "EUR_USD")
+        self.assertEqual(tick.time, 1700000000.5)
@@ -0,0 +1,37 @@
+import unittest
+from src import bars
+
+class TestBars(unittest.TestCase):
+    def test_bars_close_per_timeframe(self):
+        closed = []
+        builder = bars.BarBuilder({"S5": 5, "M1": 60}, capacity=4,
+                                  on_close=lambda name, bar: closed.append((name, bar["close"])))
+        for t, price in [(0, 1.0), (2, 1.5), (3, 0.5), (6, 1.2), (61, 1.3)]:
+            builder.update(t, price)
+        s5 = builder.bars("S5")
+        self.assertEqual(len(s5), 2)
+        self.assertEqual(tuple(s5[0]), (0, 1.0, 1.5, 0.5, 0.5, 3))
+        self.assertEqual(builder.bars("M1")[0]["high"], 1.5)
+        self.assertEqual(closed, [("S5", 0.5), ("S5", 1.2), ("M1", 1.2)])
+
+    def test_ring_buffer_keeps_latest(self):
+        builder = bars.BarBuilder({"S5": 5}, capacity=3)
+        for t in range(0, 50, 5):
+            builder.update(t, float(t))
+        self.assertEqual(list(builder.bars("S5")["open"]), [30.0, 35.0, 40.0])
+
+    def test_recent_wraps_ring_buffer(self):
+        builder = bars.BarBuilder({"S5": 5}, capacity=3)
+        for t in range(0, 50, 5):
+            builder.update(t, float(t))
+        self.assertEqual(builder.count("S5"), 9)
+        self.assertEqual(list(builder.recent("S5", 2)["open"]), [35.0, 40.0])
+
+    def test_fill_gaps_keeps_a_fixed_grid(self):
+        builder = bars.BarBuilder({"M1": 60}, fill_gaps=True)
+        for t, price in [(0, 1.0), (10, 1.2), (185, 1.5)]:
+            builder.update(t, price)
+        closed = builder.bars("M1")
+        self.assertEqual(list(closed["time"]), [0, 60, 120])
+        self.assertEqual(list(closed["close"]), [1.2, 1.2, 1.2])
+        self.assertEqual(list(closed["volume"]), [2, 0, 0])
@@ -0,0 +1,68 @@
+import unittest
+import numpy as np
+from src import config_manager, polling, strategies
+
+class TestPolling(unittest.TestCase):
+    def setUp(self):
+        self.poller = polling.PollScheduler(["EUR_USD", "GBP_USD"], config_manager.DEFAULT_CONFIG)
+
+    def test_near_trigger_polls_faster(self):
+        urgency = self.poller.urgency(np.array([0.9, 0.0]), np.full(2, np.nan), np.full(2, np.nan))
+        intervals = self.poller.intervals(urgency, np.array([True, True]))
+        self.assertLess(intervals[0], intervals[1])
+        self.assertEqual(intervals[1], config_manager.DEFAULT_CONFIG["POLL_MAX_INTERVAL"])
+
+    def test_budget_limits_requests_not_pairs(self):
+        config = config_manager.DEFAULT_CONFIG
+        pairs = [f"P{i}" for i in range(20)]
+        poller = polling.PollScheduler(pairs, config)
+        poller.current = poller.intervals(np.ones(20), np.ones(20, dtype=bool))
+        self.assertTrue(np.all(poller.current == config["POLL_MIN_INTERVAL"]))
+        now, requests = 0.0, 0
+        while now < 60:
+            polled = poller.due(now)
+            self.assertTrue(polled.all())
+            poller.begin(now, polled)
+            requests += 1
+            now += poller.wait(now)
+        self.assertLessEqual(requests, config["POLL_BUDGET"])
+
+    def test_pairs_never_polled_faster_than_min_interval(self):
+        config = config_manager.DEFAULT_CONFIG
+        poller = polling.PollScheduler(["A", "B"], config)
+        poller.current[:] = config["POLL_MIN_INTERVAL"]
+        # B falls due 3 s after A, inside A's early-merge window.
+        poller.next_poll[:] = [0.0, 3.0]
+        gaps, last, now = [], {}, 0.0
+        while now < 600:
+            polled = poller.due(now)
+            for pair, due in zip(poller.pairs, polled):
+                if due:
+                    if pair in last:
+                        gaps.append(now - last[pair])
+                    last[pair] = now
+            poller.begin(now, polled)
+            now += poller.wait(now)
+        self.assertGreaterEqual(min(gaps), config["POLL_MIN_INTERVAL"])
+
+    def test_proximity_uses_strategy_params(self):
+        default = strategies.RsiEmaStrategy(RSI_PERIOD=4, EMA_PERIOD=4)
+        engine = strategies.StrategyEngine(["A"], [default], window=20)
+        for price in [1.0, 0.99, 1.0, 0.99, 1.0, 0.99, 1.0, 0.99, 1.0]:
+            engine.update([price])
+        rsi = engine.indicator("rsi", 4)[0]
+        self.assertAlmostEqual(rsi, 50)
+        self.assertEqual(engine.proximity(15)[0], 0)
+        # A strategy with its own, closer threshold makes the pair urgent.
+        engine.register(strategies.RsiEmaStrategy(RSI_PERIOD=4, EMA_PERIOD=4, RSI_BUY_THRESHOLD=45))
+        self.assertGreater(engine.proximity(15)[0], 0)
+        self.assertEqual(engine.max_period, 4)
+
+    def test_invalid_config_rejected(self):
+        config = config_manager.DEFAULT_CONFIG
+        with self.assertRaises(ValueError):
+            polling.PollScheduler([], config)
+        with self.assertRaises(ValueError):
+            polling.PollScheduler(["A"], dict(config, POLL_BUDGET=0))
+        with self.assertRaises(ValueError):
+            polling.PollScheduler(["A"], dict(config, POLL_MIN_INTERVAL=0))
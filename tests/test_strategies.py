@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+from src import indicators, strategies
+
+class TestStrategies(unittest.TestCase):
+    def test_batch_indicators_match_scalar(self):
+        prices = np.random.rand(40) + 1
+        engine = strategies.StrategyEngine(["EUR_USD", "GBP_USD"])
+        for p in prices:
+            engine.update([p, np.nan])
+        self.assertAlmostEqual(engine.indicator("rsi", 14)[0], indicators.calculate_rsi(prices, 14))
+        self.assertAlmostEqual(engine.indicator("ema", 20)[0], indicators.calculate_ema(prices, 20))
+        self.assertEqual(engine.indicator("rsi", 14)[1], 50)
+
+    def test_rsi_ema_intents(self):
+        engine = strategies.StrategyEngine(["EUR_USD", "GBP_USD"], [
+            strategies.RsiEmaStrategy(),
+            strategies.RsiEmaStrategy(RSI_BUY_THRESHOLD=0, RSI_SELL_THRESHOLD=100)
+        ])
+        falling = np.linspace(2.0, 1.0, 30)
+        for p in falling:
+            engine.update([p, 3.0 - p])
+        intents = engine.evaluate()
+        self.assertEqual([(i.pair, i.units) for i in intents], [("EUR_USD", 1000), ("GBP_USD", -1000)])
+        self.assertLess(intents[0].stop_loss, falling[-1])
+        self.assertLess(intents[1].take_profit, 3.0 - falling[-1])
+
+    def test_window_covers_long_periods(self):
+        strategy = strategies.RsiEmaStrategy(EMA_PERIOD=200)
+        window = strategies.required_window([strategy])
+        self.assertEqual(window, 201)
+        engine = strategies.StrategyEngine(["EUR_USD"], [strategy], window)
+        for p in np.linspace(1.0, 2.0, 250):
+            engine.update([p])
+        self.assertEqual([i.units for i in engine.evaluate()], [-1000])
+        with self.assertRaises(ValueError):
+            strategies.StrategyEngine(["EUR_USD"], [strategy])
+
+    def test_load_strategies_rejects_unknown(self):
+        loaded = strategies.load_strategies({"STRATEGIES": [
+            {"name": "rsi_ema"}, {"name": "rsi_ema", "foo": 1}, {"name": "nope"}
+        ]})
+        self.assertEqual(len(loaded), 1)
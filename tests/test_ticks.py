@@ -0,0 +1,46 @@
+import unittest
+from src import ticks
+
+REST = (b'{"prices":[{"asks":[{"liquidity":10000000,"price":"1.13028"}],'
+        b'"bids":[{"liquidity":10000000,"price":"1.13015"}],"instrument":"USD_CAD",'
+        b'"status":"tradeable","time":"2016-06-22T18:41:36.201836422Z"},'
+        b'{"asks":[{"liquidity":5000000,"price":"0.99730"}],'
+        b'"bids":[{"liquidity":2000000,"price":"0.99710"}],"instrument":"USD_CHF",'
+        b'"status":"tradeable","time":"2016-06-22T18:41:36.201836422Z"}],'
+        b'"time":"2016-06-22T18:41:36.277811043Z"}')
+STREAM = (b'{"type":"PRICE","time":"1466620896.201836422","bids":[{"price":"1.13389","liquidity":10000000}],'
+          b'"asks":[{"price":"1.13404","liquidity":10000000}],"tradeable":false,"instrument":"EUR_USD"}')
+
+TIME_FIRST = (b'{"time":"100.0","prices":['
+              b'{"type":"PRICE","time":"1.0","bids":[{"price":"1.1","liquidity":1}],'
+              b'"asks":[{"price":"1.2","liquidity":1}],"instrument":"A_B",'
+              b'"unitsAvailable":{"default":{"long":"1","short":"1"}}},'
+              b'{"type":"PRICE","time":"2.0","bids":[{"price":"1.3","liquidity":1}],'
+              b'"asks":[{"price":"1.4","liquidity":1}],"instrument":"C_D"}]}')
+MISSING_TIME = (b'{"prices":[{"bids":[{"price":"1.1","liquidity":1}],"asks":[{"price":"1.2","liquidity":1}],'
+                b'"instrument":"A_B"},{"time":"2.0","bids":[{"price":"1.3","liquidity":1}],'
+                b'"asks":[{"price":"1.4","liquidity":1}],"instrument":"C_D"}],"time":"100.0"}')
+
+class TestTicks(unittest.TestCase):
+    def test_decode_multi_instrument(self):
+        result = ticks.decode_prices(REST)
+        self.assertEqual([t.instrument for t in result], ["USD_CAD", "USD_CHF"])
+        self.assertEqual(result[1].liquidity, 2000000)
+        self.assertAlmostEqual(result[1].mid, 0.9972)
+        self.assertAlmostEqual(result[0].time, 1466620896.201836, places=5)
+
+    def test_decode_stream_line(self):
+        tick, = ticks.decode_prices(STREAM)
+        self.assertFalse(tick.tradeable)
+        self.assertAlmostEqual(tick.spread, 0.00015)
+        self.assertEqual(ticks.decode_prices(b'{"type":"HEARTBEAT","time":"1466620896.2"}'), [])
+
+    def test_times_stay_with_their_price(self):
+        self.assertEqual([(t.instrument, t.time) for t in ticks.decode_prices(TIME_FIRST)],
+                         [("A_B", 1.0), ("C_D", 2.0)])
+        self.assertEqual([(t.instrument, t.time) for t in ticks.decode_prices(MISSING_TIME)],
+                         [("C_D", 2.0)])
+
+    def test_empty_bids_are_skipped(self):
+        payload = REST.replace(b'"bids":[{"liquidity":10000000,"price":"1.13015"}]', b'"bids":[]')
+        self.assertEqual([t.instrument for t in ticks.decode_prices(payload)], ["USD_CHF"])
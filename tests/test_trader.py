@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+from unittest import mock
+from src import bars, config_manager, polling, strategies, ticks, trader
+
+class TestTrader(unittest.TestCase):
+    def test_failed_trade_still_backs_off(self):
+        config = config_manager.DEFAULT_CONFIG
+        engine = strategies.StrategyEngine(config["PAIRS"])
+        poller = polling.PollScheduler(config["PAIRS"], config, now=1000.0)
+        failing = mock.AsyncMock(side_effect=RuntimeError("boom"))
+        with mock.patch.object(trader, "fetch_ticks_async", failing), \
+                mock.patch.object(trader.time, "time", return_value=1000.0):
+            with self.assertRaises(RuntimeError):
+                asyncio.run(trader.trade(engine, poller, {}, None, "ACCOUNT", "TOKEN"))
+        self.assertGreaterEqual(poller.wait(1000.0), 60 / config["POLL_BUDGET"])
+        self.assertGreater(poller.next_poll.min(), 1000.0)
+
+    def test_trade_feeds_bar_builders(self):
+        config = config_manager.DEFAULT_CONFIG
+        engine = strategies.StrategyEngine(["EUR_USD"])
+        poller = polling.PollScheduler(["EUR_USD"], config)
+        builders = {"EUR_USD": bars.BarBuilder()}
+        for t in (0.0, 30.0, 61.0):
+            quote = mock.AsyncMock(return_value=[ticks.Tick("EUR_USD", t, 1.0, 1.0002)])
+            with mock.patch.object(trader, "fetch_ticks_async", quote), \
+                    mock.patch.object(trader.time, "time", return_value=t):
+                poller.next_poll[:] = t
+                asyncio.run(trader.trade(engine, poller, builders, None, "ACCOUNT", "TOKEN"))
+        candle, = builders["EUR_USD"].bars("M1")
+        self.assertEqual(candle["volume"], 2)
+
+    def run_session(self, poll_every, seconds=900):
+        config = config_manager.DEFAULT_CONFIG
+        engine = strategies.StrategyEngine(["EUR_USD"], [strategies.RsiEmaStrategy()])
+        poller = polling.PollScheduler(["EUR_USD"], config)
+        builders = {"EUR_USD": bars.BarBuilder(fill_gaps=True)}
+        orders = mock.AsyncMock(return_value="1")
+        for t in range(0, seconds, poll_every):
+            price = 2.0 - t * 1e-4
+            quote = mock.AsyncMock(return_value=[ticks.Tick("EUR_USD", float(t), price, price)])
+            with mock.patch.object(trader, "fetch_ticks_async", quote), \
+                    mock.patch.object(trader, "place_order_async", orders), \
+                    mock.patch.object(trader.time, "time", return_value=float(t)):
+                poller.next_poll[:] = t
+                asyncio.run(trader.trade(engine, poller, builders, None, "ACCOUNT", "TOKEN"))
+        return orders.await_count, builders["EUR_USD"].count(config["SIGNAL_TIMEFRAME"])
+
+    def test_orders_do_not_scale_with_poll_rate(self):
+        fast_orders, fast_bars = self.run_session(5)
+        slow_orders, slow_bars = self.run_session(30)
+        self.assertGreater(slow_orders, 0)
+        self.assertLessEqual(fast_orders, fast_bars)
+        self.assertEqual(fast_orders, slow_orders)
+
+    def run_bot_until_cancelled(self, session=None):
+        """Cancel run_bot while its first price request is in flight."""
+        started = []
+
+        async def hang(session, *args):
+            started.append(session)
+            await asyncio.Event().wait()
+
+        async def scenario():
+            task = asyncio.ensure_future(trader.run_bot("ACCOUNT", "TOKEN", session))
+            while not started:
+                await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return started[0]
+
+        with mock.patch.object(trader, "fetch_ticks_async", hang):
+            return asyncio.run(scenario())
+
+    def test_cancelled_run_bot_leaves_caller_session_open(self):
+        session = mock.Mock(closed=False)
+        used = self.run_bot_until_cancelled(session)
+        self.assertIs(used, session)
+        session.close.assert_not_called()
+
+    def test_cancelled_run_bot_closes_own_session(self):
+        used = self.run_bot_until_cancelled()
+        self.assertTrue(used.closed)